@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from viadot.exceptions import APIError
 from viadot.tasks import MindfulToCSV
 
 
@@ -22,8 +23,38 @@ def test_instance_mindful():
 def test_mindful_run(mock_interactions):
     mf = MindfulToCSV()
     mf.run()
-    mock_interactions.call_count == 2
-    assert os.path.exists("interactions.csv")
-    os.remove("interactions.csv")
-    assert os.path.exists("responses.csv")
-    os.remove("responses.csv")
+    assert mock_interactions.call_count == 3
+    urls = sorted(call.kwargs["url"] for call in mock_interactions.call_args_list)
+    assert [url.split("/")[-1] for url in urls] == [
+        "interactions",
+        "responses",
+        "surveys",
+    ]
+    assert os.path.exists("interactions.parquet")
+    os.remove("interactions.parquet")
+    assert os.path.exists("responses.parquet")
+    os.remove("responses.parquet")
+    assert os.path.exists("surveys.parquet")
+    os.remove("surveys.parquet")
+
+
+def mock_api_response_responses_error(url, **kwargs):
+    if url.endswith("/responses"):
+        raise APIError("Failed to downloaded responses data.")
+    return MockClass
+
+
+@mock.patch(
+    "viadot.sources.mindful.handle_api_response",
+    side_effect=mock_api_response_responses_error,
+)
+@pytest.mark.run
+def test_mindful_run_endpoint_error(mock_api_response):
+    mf = MindfulToCSV()
+    with pytest.raises(APIError, match="responses"):
+        mf.run()
+    assert mock_api_response.call_count == 3
+    assert os.path.exists("interactions.parquet")
+    os.remove("interactions.parquet")
+    assert not os.path.exists("responses.parquet")
+    assert not os.path.exists("surveys.parquet")
@@ -1,4 +1,5 @@
 import os
+import shutil
 from unittest import mock
 
 import pytest
@@ -97,8 +98,8 @@ def test_mindful_interactions(mock_connection):
     mf.response_to_file(response)
     assert mf.endpoint == "interactions" and isinstance(mf.endpoint, str)
 
-    assert os.path.exists("interactions.csv")
-    os.remove("interactions.csv")
+    assert os.path.exists("interactions.parquet")
+    os.remove("interactions.parquet")
 
 
 @mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass)
@@ -109,8 +110,8 @@ def test_mindful_responses(mock_connection):
     mf.response_to_file(response)
 
     assert mf.endpoint == "responses" and isinstance(mf.endpoint, str)
-    assert os.path.exists("responses.csv")
-    os.remove("responses.csv")
+    assert os.path.exists("responses.parquet")
+    os.remove("responses.parquet")
 
 
 @mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass)
@@ -121,10 +122,43 @@ def test_mindful_surveys(mock_connection):
     mf.response_to_file(response)
 
     assert mf.endpoint == "surveys" and isinstance(mf.endpoint, str)
+    assert os.path.exists("surveys.parquet")
+    os.remove("surveys.parquet")
+
+
+@mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass)
+@pytest.mark.save
+def test_mindful_surveys_csv(mock_connection):
+    mf = Mindful(auth=auth, file_extension="csv")
+    response = mf.get_survey_list()
+    mf.response_to_file(response)
+
     assert os.path.exists("surveys.csv")
     os.remove("surveys.csv")
 
 
+@mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass)
+@pytest.mark.save
+def test_mindful_surveys_feather(mock_connection):
+    mf = Mindful(auth=auth, file_extension="feather")
+    response = mf.get_survey_list()
+    mf.response_to_file(response)
+
+    assert os.path.exists("surveys.feather")
+    os.remove("surveys.feather")
+
+
+@mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass)
+@pytest.mark.save
+def test_mindful_surveys_missing_file_path(mock_connection):
+    mf = Mindful(auth=auth)
+    response = mf.get_survey_list()
+    path = mf.response_to_file(response, file_path="mindful_test_dir/nested")
+
+    assert os.path.exists(path)
+    shutil.rmtree("mindful_test_dir")
+
+
 @mock.patch("viadot.sources.Mindful._mindful_api_response", return_value=MockClass2)
 @pytest.mark.exception
 def test_file_exception(mock_mindful):
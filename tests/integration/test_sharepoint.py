@@ -86,6 +86,17 @@ def test_connection(sharepoint):
     assert response.status_code == 200
 
 
+def test_connection_is_shared_between_instances(sharepoint):
+    """
+    Testing if instances with the same credentials share one cached session.
+
+    Args:
+        sharepoint (Sharepoint): Sharepoint class instance.
+    """
+    other = Sharepoint(credentials=sharepoint.credentials)
+    assert other.get_connection() is sharepoint.get_connection()
+
+
 def test_sharepoint_to_df_task():
     """Testing if result of `SharepointToDF` is a Data Frame."""
     task = SharepointToDF()
@@ -0,0 +1,54 @@
+import json
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from viadot.sources import Sharepoint
+from viadot.tasks.sharepoint import SharepointToDF
+
+CREDENTIALS = {
+    "site": "tenant.sharepoint.com",
+    "username": "user@tenant.com",
+    "password": "password",
+}
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    path = tmp_path / "test_sharepoint_to_df.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x\ny", "p\tq", "z"]}).to_excel(
+            writer, sheet_name="Sheet1", index=False
+        )
+        pd.DataFrame(columns=["a", "b"]).to_excel(
+            writer, sheet_name="Empty", index=False
+        )
+        pd.DataFrame({"a": [4, 5], "b": ["u", "v"]}).to_excel(
+            writer, sheet_name="Sheet3", index=False
+        )
+    yield str(path)
+
+
+@mock.patch.object(Sharepoint, "download_file")
+@mock.patch("viadot.tasks.sharepoint.AzureKeyVaultSecret")
+def test_sharepoint_to_df_multiple_sheets(
+    mock_key_vault_secret, mock_download_file, excel_file
+):
+    mock_key_vault_secret.return_value.run.return_value = json.dumps(CREDENTIALS)
+
+    task = SharepointToDF()
+    df = task.run(
+        path_to_file=excel_file,
+        url_to_file="https://tenant.sharepoint.com/sites/site/file.xlsx",
+        nrows=2,
+        credentials_secret="SHAREPOINT-SECRET",
+    )
+
+    mock_download_file.assert_called_once()
+    assert df.columns.tolist() == ["a", "b", "sheet_name", "_viadot_source"]
+    assert isinstance(df.index, pd.RangeIndex)
+    assert df.index.tolist() == [0, 1, 2, 3, 4]
+    assert df["a"].tolist() == [1, 2, 3, 4, 5]
+    assert df["b"].tolist() == ["xy", "pq", "z", "u", "v"]
+    assert df["sheet_name"].tolist() == ["Sheet1"] * 3 + ["Sheet3"] * 2
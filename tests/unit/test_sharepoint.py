@@ -0,0 +1,97 @@
+import os
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from requests.exceptions import HTTPError
+from requests.models import Response
+
+from viadot.exceptions import CredentialError
+from viadot.sources import Sharepoint
+from viadot.sources import sharepoint as sharepoint_module
+
+TEST_FILE = "test_sharepoint_file.xlsx"
+CREDENTIALS = {
+    "site": "tenant.sharepoint.com",
+    "username": "user@tenant.com",
+    "password": "password",
+}
+
+
+@pytest.fixture
+def empty_session_cache():
+    sharepoint_module._sessions.clear()
+    yield
+    sharepoint_module._sessions.clear()
+
+
+@mock.patch("viadot.sources.sharepoint.time.monotonic", return_value=0)
+@mock.patch("viadot.sources.sharepoint.sharepy.connect")
+def test_session_shared_between_instances(
+    mock_connect, mock_monotonic, empty_session_cache
+):
+    """Testing if instances with the same credentials authenticate only once."""
+    s1 = Sharepoint(credentials=CREDENTIALS)
+    s2 = Sharepoint(credentials=CREDENTIALS)
+
+    assert s1.get_connection() is s2.get_connection()
+    mock_connect.assert_called_once()
+
+
+@mock.patch("viadot.sources.sharepoint.time.monotonic")
+@mock.patch("viadot.sources.sharepoint.sharepy.connect")
+def test_session_expires(mock_connect, mock_monotonic, empty_session_cache):
+    """Testing if an expired session is replaced, without closing the old one."""
+    old_session, new_session = mock.MagicMock(), mock.MagicMock()
+    mock_connect.side_effect = [old_session, new_session]
+    s = Sharepoint(credentials=CREDENTIALS)
+
+    mock_monotonic.return_value = 0
+    assert s.get_connection() is old_session
+
+    mock_monotonic.return_value = sharepoint_module.SESSION_TTL - 1
+    assert s.get_connection() is old_session
+
+    mock_monotonic.return_value = sharepoint_module.SESSION_TTL
+    assert s.get_connection() is new_session
+    assert mock_connect.call_count == 2
+    old_session.close.assert_not_called()
+
+
+@mock.patch("viadot.sources.sharepoint.time.monotonic", return_value=0)
+@mock.patch("viadot.sources.sharepoint.sharepy.connect")
+def test_session_failed_authentication(
+    mock_connect, mock_monotonic, empty_session_cache
+):
+    """Testing if a session without the authentication cookie is not cached."""
+    failed_session, session = mock.Mock(spec=["close"]), mock.MagicMock()
+    mock_connect.side_effect = [failed_session, session]
+    s = Sharepoint(credentials=CREDENTIALS)
+
+    with pytest.raises(CredentialError, match="authentication failed"):
+        s.get_connection()
+    assert not sharepoint_module._sessions
+
+    assert s.get_connection() is session
+    assert mock_connect.call_count == 2
+
+
+def test_download_file_http_error(empty_session_cache):
+    """Testing if a non-200 response raises, doesn't create the file and evicts the session."""
+    response = Response()
+    response.status_code = 403
+    response.raw = BytesIO(b"<html>Access denied</html>")
+    response.url = "https://tenant.sharepoint.com/sites/site/file.xlsx"
+    conn = mock.MagicMock()
+    conn.get.return_value = response
+
+    key = sharepoint_module._session_key(**CREDENTIALS)
+    sharepoint_module._sessions[key] = (conn, 0)
+
+    s = Sharepoint(credentials=CREDENTIALS)
+    with mock.patch.object(Sharepoint, "get_connection", return_value=conn):
+        with pytest.raises(HTTPError):
+            s.download_file(download_from_path=response.url, download_to_path=TEST_FILE)
+
+    assert not os.path.exists(TEST_FILE)
+    assert key not in sharepoint_module._sessions
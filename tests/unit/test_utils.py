@@ -8,6 +8,7 @@ from viadot.exceptions import APIError
 from viadot.signals import SKIP
 from viadot.utils import (
     add_viadot_metadata_columns,
+    cast_df_mixed_dtypes_to_string,
     check_if_empty_file,
     gen_bulk_insert_query_from_df,
     get_nested_value,
@@ -15,6 +16,7 @@ from viadot.utils import (
     handle_api_response,
     union_dict,
     gen_bulk_insert_query_from_df,
+    write_df_to_file,
 )
 
 EMPTY_CSV_PATH = "empty.csv"
@@ -321,3 +323,44 @@ def test_get_nested_value_non_dict_passed():
     """Sample test checking the correctness of the function when non dict value (int) is provided."""
 
     assert get_nested_value(nested_dict=5) == None
+
+
+def test_cast_df_mixed_dtypes_to_string():
+    df = pd.DataFrame(
+        {
+            "mixed": [1, "a", None],
+            "str": ["a", "b", None],
+            "int": [1, 2, 3],
+        }
+    )
+    df_casted = cast_df_mixed_dtypes_to_string(df)
+
+    assert df_casted["mixed"].dtype == "string"
+    assert df_casted["mixed"].isna().iloc[2]
+    assert df_casted["str"].dtype == object
+    assert df_casted["int"].dtype == "int64"
+    df_casted.to_parquet("mixed_dtypes.parquet", index=False)
+    os.remove("mixed_dtypes.parquet")
+
+
+@pytest.mark.parametrize("file_extension", ["parquet", "feather", "csv"])
+def test_write_df_to_file(file_extension):
+    df = pd.DataFrame({"mixed": [1, "a"], "str": ["a", "b"]})
+    path = f"test_write_df_to_file.{file_extension}"
+
+    write_df_to_file(df, path, file_extension)
+
+    if file_extension == "parquet":
+        df_read = pd.read_parquet(path)
+    elif file_extension == "feather":
+        df_read = pd.read_feather(path)
+    else:
+        df_read = pd.read_csv(path, sep="\t")
+    os.remove(path)
+    assert df_read["mixed"].astype(str).tolist() == ["1", "a"]
+    assert df_read["str"].tolist() == ["a", "b"]
+
+
+def test_write_df_to_file_wrong_extension():
+    with pytest.raises(ValueError, match="not supported"):
+        write_df_to_file(pd.DataFrame({"a": [1]}), "test.xlsx", "xlsx")
@@ -10,6 +10,7 @@ from prefect.utilities import logging
 
 from viadot.task_utils import add_ingestion_metadata_task, adls_bulk_upload
 from viadot.tasks import AzureDataLakeUpload, MindfulToCSV
+from viadot.utils import write_df_to_file
 
 logger = logging.get_logger()
 file_to_adls_task = AzureDataLakeUpload()
@@ -21,15 +22,22 @@ def add_timestamp(files_names: List = None, sep: str = "\t") -> None:
 
     Args:
         files_names (List, optional): File names where to add the new column. Defaults to None.
-        sep (str, optional): Separator type to load and to save data. Defaults to "\t".
+        sep (str, optional): Separator type to load and to save data in csv files. Defaults to "\t".
     """
     if not files_names:
         logger.warning("Avoided adding a timestamp. No files were reported.")
     else:
         for file in files_names:
-            df = pd.read_csv(file, sep=sep)
+            file_extension = os.path.splitext(file)[1][1:]
+            if file_extension == "parquet":
+                df = pd.read_parquet(file)
+            elif file_extension == "feather":
+                df = pd.read_feather(file)
+            else:
+                file_extension = "csv"
+                df = pd.read_csv(file, sep=sep)
             df_updated = add_ingestion_metadata_task.run(df)
-            df_updated.to_csv(file, index=False, sep=sep)
+            write_df_to_file(df_updated, file, file_extension, sep=sep)
 
 
 class MindfulToADLS(Flow):
@@ -42,7 +50,7 @@ class MindfulToADLS(Flow):
         end_date: datetime = None,
         date_interval: int = 1,
         region: Literal["us1", "us2", "us3", "ca1", "eu1", "au1"] = "eu1",
-        file_extension: Literal["parquet", "csv"] = "csv",
+        file_extension: Literal["parquet", "feather", "csv"] = "parquet",
         sep: str = "\t",
         timeout: int = 3600,
         file_path: str = "",
@@ -52,7 +60,7 @@ class MindfulToADLS(Flow):
         *args: List[any],
         **kwargs: Dict[str, Any]
     ):
-        """Mindful flow to download the CSV files and upload them to ADLS.
+        """Mindful flow to download the Parquet, Feather or CSV files and upload them to ADLS.
 
         Args:
             name (str): The name of the Flow.
@@ -63,7 +71,7 @@ class MindfulToADLS(Flow):
             date_interval (int, optional): How many days are included in the request.
                 If end_date is passed as an argument, date_interval will be invalidated. Defaults to 1.
             region (Literal[us1, us2, us3, ca1, eu1, au1], optional): SD region from where to interact with the mindful API. Defaults to "eu1".
-            file_extension (Literal[parquet, csv], optional): File extensions for storing responses. Defaults to "csv".
+            file_extension (Literal[parquet, feather, csv], optional): File extensions for storing responses. Defaults to "parquet".
             sep (str, optional): Separator in csv file. Defaults to "\t".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime, timedelta
 from io import StringIO
+from pathlib import Path
 from typing import Any, Dict, Literal, Tuple
 
 import pandas as pd
@@ -10,7 +11,7 @@ from requests.models import Response
 
 from viadot.exceptions import APIError
 from viadot.sources.base import Source
-from viadot.utils import handle_api_response
+from viadot.utils import handle_api_response, write_df_to_file
 
 
 class Mindful(Source):
@@ -21,7 +22,7 @@ class Mindful(Source):
         start_date: datetime = None,
         end_date: datetime = None,
         date_interval: int = 1,
-        file_extension: Literal["parquet", "csv"] = "csv",
+        file_extension: Literal["parquet", "feather", "csv"] = "parquet",
         *args,
         **kwargs,
     ) -> None:
@@ -34,7 +35,7 @@ class Mindful(Source):
             end_date (datetime, optional): End date of the resquest. Defaults to None.
             date_interval (int, optional): How many days are included in the request.
                 If end_date is passed as an argument, date_interval will be invalidated. Defaults to 1.
-            file_extension (Literal[parquet, csv], optional): File extensions for storing responses. Defaults to "csv".
+            file_extension (Literal[parquet, feather, csv], optional): File extensions for storing responses. Defaults to "parquet".
         """
         self.logger = prefect.context.get("logger")
 
@@ -115,7 +116,8 @@ class Mindful(Source):
             Response: request object with the response from the Mindful API.
         """
 
-        self.endpoint = "interactions"
+        endpoint = "interactions"
+        self.endpoint = endpoint
         params = {
             "_limit": limit,
             "start_date": f"{self.start_date}",
@@ -123,7 +125,7 @@ class Mindful(Source):
         }
 
         response = self._mindful_api_response(
-            endpoint=self.endpoint,
+            endpoint=endpoint,
             params=params,
         )
 
@@ -157,7 +159,8 @@ class Mindful(Source):
             Response: request object with the response from the Mindful API.
         """
 
-        self.endpoint = "responses"
+        endpoint = "responses"
+        self.endpoint = endpoint
         params = {
             "_limit": limit,
             "start_date": f"{self.start_date}",
@@ -165,7 +168,7 @@ class Mindful(Source):
         }
 
         response = self._mindful_api_response(
-            endpoint=self.endpoint,
+            endpoint=endpoint,
             params=params,
         )
 
@@ -196,13 +199,14 @@ class Mindful(Source):
         Returns:
             Response: Request object with the response from the Mindful API.
         """
-        self.endpoint = "surveys"
+        endpoint = "surveys"
+        self.endpoint = endpoint
         params = {
             "_limit": limit,
         }
 
         response = self._mindful_api_response(
-            endpoint=self.endpoint,
+            endpoint=endpoint,
             params=params,
         )
 
@@ -230,7 +234,8 @@ class Mindful(Source):
         Args:
             response (Response): Request object with the response from the Mindful API.
             file_name (str, optional): Name of the file where saving data. Defaults to None.
-            file_path (str, optional): Path where to save the file locally. Defaults to ''.
+            file_path (str, optional): Path where to save the file locally. It is created if it
+                does not exist. Defaults to ''.
             sep (str, optional): Separator in csv file. Defaults to "\t".
 
         returns
@@ -245,13 +250,14 @@ class Mindful(Source):
             complete_file_name = f"{file_name}.{self.file_extension}"
             relative_path = os.path.join(file_path, complete_file_name)
 
-        if self.file_extension == "csv":
-            data_frame.to_csv(relative_path, index=False, sep=sep)
-        elif self.file_extension == "parquet":
-            data_frame.to_parquet(relative_path, index=False)
+        if file_path:
+            Path(file_path).mkdir(parents=True, exist_ok=True)
+
+        if self.file_extension in ("parquet", "feather", "csv"):
+            write_df_to_file(data_frame, relative_path, self.file_extension, sep=sep)
         else:
             self.logger.warning(
-                "File extension is not available, please choose file_extension: 'parquet' or 'csv' (def.) at Mindful instance."
+                "File extension is not available, please choose file_extension: 'parquet' (def.), 'feather' or 'csv' at Mindful instance."
             )
 
         return relative_path
@@ -1,7 +1,10 @@
+import hashlib
+import threading
+import time
 from copy import deepcopy
 from datetime import datetime
 from fnmatch import fnmatch
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 import sharepy
@@ -19,11 +22,77 @@ from .base import Source
 logger = logging.get_logger()
 
 
+# Sharepoint sessions are shared between `Sharepoint` instances (eg. several tasks
+# in one flow run) and re-authenticated once they are older than this many seconds.
+SESSION_TTL = 50 * 60
+
+_sessions: Dict[
+    Tuple[str, str, str], Tuple[sharepy.session.SharePointSession, float]
+] = {}
+_sessions_lock = threading.Lock()
+
+
 # Print out how many rows was extracted in specific iteration
 def log_of_progress(items):
     logger.info("Items read: {0}".format(len(items)))
 
 
+def _session_key(site: str, username: str, password: str) -> Tuple[str, str, str]:
+    return (site, username, hashlib.sha256(password.encode()).hexdigest())
+
+
+def get_cached_session(
+    site: str, username: str, password: str
+) -> sharepy.session.SharePointSession:
+    """Return an authenticated Sharepoint session, reusing a cached one if it has not expired.
+
+    Args:
+        site (str): Path to sharepoint website (e.g : {tenant_name}.sharepoint.com).
+        username (str): Sharepoint username.
+        password (str): Sharepoint password.
+
+    Raises:
+        CredentialError: If the authentication fails.
+
+    Returns:
+        sharepy.session.SharePointSession: Authenticated Sharepoint session.
+    """
+    key = _session_key(site, username, password)
+    with _sessions_lock:
+        cached = _sessions.get(key)
+        if cached is not None:
+            session, created_at = cached
+            if time.monotonic() - created_at < SESSION_TTL:
+                return session
+            # Expired sessions are only dropped from the cache, not closed, as other
+            # `Sharepoint` instances may still be using them.
+            del _sessions[key]
+
+    # Authenticate without holding the lock, so that a slow login doesn't block
+    # the logins for other sites and users.
+    session = sharepy.connect(site=site, username=username, password=password)
+    # sharepy doesn't raise on failed authentication, it returns a session without
+    # the authentication cookie instead.
+    if not getattr(session, "cookie", None):
+        raise CredentialError("Sharepoint authentication failed.")
+
+    with _sessions_lock:
+        _sessions[key] = (session, time.monotonic())
+    return session
+
+
+def evict_cached_session(site: str, username: str, password: str) -> None:
+    """Remove the cached Sharepoint session for the given credentials, if there is one.
+
+    Args:
+        site (str): Path to sharepoint website (e.g : {tenant_name}.sharepoint.com).
+        username (str): Sharepoint username.
+        password (str): Sharepoint password.
+    """
+    with _sessions_lock:
+        _sessions.pop(_session_key(site, username, password), None)
+
+
 class Sharepoint(Source):
     """
     A Sharepoint class to connect and download specific Excel file from Sharepoint.
@@ -53,10 +122,17 @@ class Sharepoint(Source):
         super().__init__(*args, credentials=credentials, **kwargs)
 
     def get_connection(self) -> sharepy.session.SharePointSession:
+        """Return the Sharepoint session, authenticating only if no valid session
+        for these credentials is cached yet. The cache is checked on every call,
+        so an expired session is replaced even on long-lived instances.
+
+        Returns:
+            sharepy.session.SharePointSession: Authenticated Sharepoint session.
+        """
         if any([rq not in self.credentials for rq in self.required_credentials]):
             raise CredentialError("Missing credentials.")
 
-        return sharepy.connect(
+        return get_cached_session(
             site=self.credentials["site"],
             username=self.credentials["username"],
             password=self.credentials["password"],
@@ -66,21 +142,37 @@ class Sharepoint(Source):
         self,
         download_from_path: str = None,
         download_to_path: str = "Sharepoint_file.xlsm",
+        chunk_size: int = 1024 * 1024,
     ) -> None:
         """Function to download files from Sharepoint.
         Args:
             download_from_path (str): Path from which to download file. Defaults to None.
             download_to_path (str, optional): Path to destination file. Defaults to "Sharepoint_file.xlsm".
+            chunk_size (int, optional): Number of bytes streamed to the file at a time. Defaults to 1 MiB.
+
+        Raises:
+            HTTPError: If Sharepoint does not return the file, eg. due to missing permissions.
+                On 401 and 403 responses the cached session is evicted.
         """
         download_from_path = download_from_path or self.url
         if not download_from_path:
             raise ValueError("Missing required parameter 'download_from_path'.")
 
         conn = self.get_connection()
-        conn.getfile(
-            url=download_from_path,
-            filename=download_to_path,
-        )
+        # Stream the body straight to disk so the file is never held in memory as a whole.
+        with conn.get(download_from_path, stream=True) as response:
+            if response.status_code in (401, 403):
+                # The cached session might have been invalidated, so don't reuse it.
+                evict_cached_session(
+                    site=self.credentials["site"],
+                    username=self.credentials["username"],
+                    password=self.credentials["password"],
+                )
+            # Fail before opening the file, so an error page never overwrites it.
+            response.raise_for_status()
+            with open(download_to_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
 
 
 class SharepointList(Source):
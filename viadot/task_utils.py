@@ -180,10 +180,12 @@ def df_map_mixed_dtypes_for_parquet(
     Returns:
         df_mapped (pd.DataFrame): Pandas DataFrame with mapped Data Types to workaround Pandas to_parquet bug connected with mixed dtypes in object:.
     """
-    df_mapped = df.copy()
-    for col, dtype in dtypes_dict.items():
-        if dtype == "Object":
-            df_mapped[col] = df_mapped[col].astype("string")
+    # Cast all affected columns in a single `astype` call instead of copying the whole
+    # frame upfront and reassigning column by column.
+    columns_to_cast = {
+        col: "string" for col, dtype in dtypes_dict.items() if dtype == "Object"
+    }
+    df_mapped = df.astype(columns_to_cast)
     return df_mapped
 
 
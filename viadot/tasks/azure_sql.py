@@ -391,9 +391,7 @@ class CheckColumnOrder(Task):
         Args:
             df(pd.DataFrame): Dataframe to transform. Defaults to None.
         """
-        for col in df.columns:
-            df = df.rename(columns={col: col.strip()})
-        return df
+        return df.rename(columns=lambda col: col.strip())
 
     def run(
         self,
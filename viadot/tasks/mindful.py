@@ -1,5 +1,5 @@
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Literal
 
@@ -23,7 +23,7 @@ class MindfulToCSV(Task):
         end_date: datetime = None,
         date_interval: int = 1,
         region: Literal["us1", "us2", "us3", "ca1", "eu1", "au1"] = "eu1",
-        file_extension: Literal["parquet", "csv"] = "csv",
+        file_extension: Literal["parquet", "feather", "csv"] = "parquet",
         file_path: str = "",
         timeout: int = 3600,
         *args: List[Any],
@@ -38,7 +38,7 @@ class MindfulToCSV(Task):
             date_interval (int, optional): How many days are included in the request.
                 If end_date is passed as an argument, date_interval will be invalidated. Defaults to 1.
             region (Literal[us1, us2, us3, ca1, eu1, au1], optional): SD region from where to interact with the mindful API. Defaults to "eu1".
-            file_extension (Literal[parquet, csv], optional): File extensions for storing responses. Defaults to "csv".
+            file_extension (Literal[parquet, feather, csv], optional): File extensions for storing responses. Defaults to "parquet".
             file_path (str, optional): Path where to save the file locally. Defaults to ''.
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
@@ -97,7 +97,7 @@ class MindfulToCSV(Task):
         start_date: datetime = None,
         end_date: datetime = None,
         date_interval: int = 1,
-        file_extension: Literal["parquet", "csv"] = "csv",
+        file_extension: Literal["parquet", "feather", "csv"] = "parquet",
         region: Literal["us1", "us2", "us3", "ca1", "eu1", "au1"] = "eu1",
         file_path: str = "",
     ):
@@ -131,40 +131,35 @@ class MindfulToCSV(Task):
             file_extension=file_extension,
         )
 
+        # The endpoints are independent, so they are requested concurrently instead of
+        # one after another. Files are named explicitly, as `mindful.endpoint` is
+        # overwritten by each request.
+        endpoint_requests = {
+            "interactions": mindful.get_interactions_list,
+            "responses": mindful.get_responses_list,
+            "surveys": mindful.get_survey_list,
+        }
+        with ThreadPoolExecutor(max_workers=len(endpoint_requests)) as executor:
+            futures = {
+                endpoint: executor.submit(get_list)
+                for endpoint, get_list in endpoint_requests.items()
+            }
+
         file_names = []
-        # interactions
-        interactions_response = mindful.get_interactions_list()
-        if interactions_response.status_code == 200:
-            interaction_file_name = mindful.response_to_file(
-                interactions_response,
-                file_path=file_path,
-            )
-            file_names.append(interaction_file_name)
-            logger.info(
-                "Successfully downloaded interactions data from the Mindful API."
-            )
-            time.sleep(0.5)
-
-        # responses
-        responses_response = mindful.get_responses_list()
-        if responses_response.status_code == 200:
-            response_file_name = mindful.response_to_file(
-                responses_response,
-                file_path=file_path,
-            )
-            file_names.append(response_file_name)
-            logger.info("Successfully downloaded responses data from the Mindful API.")
-            time.sleep(0.5)
-
-        # surveys
-        surveys_response = mindful.get_survey_list()
-        if surveys_response.status_code == 200:
-            surveys_file_name = mindful.response_to_file(
-                surveys_response,
-                file_path=file_path,
-            )
-            file_names.append(surveys_file_name)
-            logger.info("Successfully downloaded surveys data from the Mindful API.")
+        # Errors are raised in the endpoints order, after the files of the preceding
+        # endpoints have been saved.
+        for endpoint, future in futures.items():
+            response = future.result()
+            if response.status_code == 200:
+                file_name = mindful.response_to_file(
+                    response,
+                    file_name=endpoint,
+                    file_path=file_path,
+                )
+                file_names.append(file_name)
+                logger.info(
+                    f"Successfully downloaded {endpoint} data from the Mindful API."
+                )
 
         if not file_names:
             return None
@@ -4,6 +4,7 @@ import os
 import re
 from typing import List
 
+import numpy as np
 import pandas as pd
 from prefect import Task
 from prefect.tasks.secrets import PrefectSecret
@@ -89,7 +90,8 @@ class SharepointToDF(Task):
 
     def df_replace_special_chars(self, df: pd.DataFrame):
         """
-        Replace "\n" and "\t" with "".
+        Replace "\n" and "\t" with "". Only object (string) columns are processed,
+        as other columns cannot contain these characters.
 
         Args:
             df (pd.DataFrame): Pandas data frame to replace characters.
@@ -98,13 +100,18 @@ class SharepointToDF(Task):
             df (pd.DataFrame): Pandas data frame
 
         """
-        return df.replace(r"\n|\t", "", regex=True)
+        str_columns = df.select_dtypes(include="object").columns
+        if str_columns.empty:
+            return df
+        return df.replace({col: r"\n|\t" for col in str_columns}, "", regex=True)
 
     def split_sheet(
         self,
         sheetname: str = None,
         nrows: int = None,
         chunks: List[pd.DataFrame] = None,
+        excel_file: pd.ExcelFile = None,
+        add_sheet_name: bool = True,
         **kwargs,
     ) -> List[pd.DataFrame]:
         """
@@ -114,6 +121,9 @@ class SharepointToDF(Task):
             sheetname (str): The sheet on which we iterate.
             nrows (int): Number of rows to read at a time.
             chunks(List[pd.DataFrame]): List of data in chunks.
+            excel_file (pd.ExcelFile, optional): Already opened workbook to read the chunks from,
+                so that it is not loaded again for every chunk. If None, `path_to_file` is read. Defaults to None.
+            add_sheet_name (bool, optional): Whether to add a `sheet_name` column to every chunk. Defaults to True.
 
         Returns:
             List[pd.DataFrame]: List of data frames
@@ -122,9 +132,10 @@ class SharepointToDF(Task):
         logger.info(f"Worksheet: {sheetname}")
         temp_chunks = copy.deepcopy(chunks)
         i_chunk = 0
+        io = excel_file if excel_file is not None else self.path_to_file
         while True:
             df_chunk = pd.read_excel(
-                self.path_to_file,
+                io,
                 sheet_name=sheetname,
                 nrows=nrows,
                 skiprows=skiprows,
@@ -137,7 +148,8 @@ class SharepointToDF(Task):
                 break
             else:
                 logger.debug(f" - chunk {i_chunk+1} ({df_chunk.shape[0]} rows)")
-                df_chunk["sheet_name"] = sheetname
+                if add_sheet_name:
+                    df_chunk["sheet_name"] = sheetname
                 temp_chunks.append(df_chunk)
             i_chunk += 1
         return temp_chunks
@@ -199,34 +211,48 @@ class SharepointToDF(Task):
         s.download_file(download_to_path=path_to_file)
 
         self.nrows = nrows
-        excel = pd.ExcelFile(self.path_to_file)
 
-        if self.sheet_number is not None:
-            sheet_names_list = [excel.sheet_names[self.sheet_number]]
-        else:
-            sheet_names_list = excel.sheet_names
-
-        header_to_compare = None
-        chunks = []
-
-        for sheetname in sheet_names_list:
-            df_header = pd.read_excel(self.path_to_file, sheet_name=sheetname, nrows=0)
-
-            if validate_excel_file:
-                header_to_compare = self.check_column_names(
-                    df_header, header_to_compare
+        # Open the workbook once and reuse it for every header and chunk read.
+        with pd.ExcelFile(self.path_to_file) as excel:
+            if self.sheet_number is not None:
+                sheet_names_list = [excel.sheet_names[self.sheet_number]]
+            else:
+                sheet_names_list = excel.sheet_names
+
+            header_to_compare = None
+            chunks = []
+            sheet_lengths = []
+
+            for sheetname in sheet_names_list:
+                df_header = pd.read_excel(excel, sheet_name=sheetname, nrows=0)
+
+                if validate_excel_file:
+                    header_to_compare = self.check_column_names(
+                        df_header, header_to_compare
+                    )
+
+                sheet_chunks = self.split_sheet(
+                    sheetname,
+                    self.nrows,
+                    [],
+                    excel_file=excel,
+                    add_sheet_name=False,
                 )
+                chunks.extend(sheet_chunks)
+                sheet_lengths.append(sum(len(chunk) for chunk in sheet_chunks))
 
-            chunks = self.split_sheet(sheetname, self.nrows, chunks)
-            df_chunks = pd.concat(chunks)
+        # Concatenate all chunks once, after every sheet has been read, and add
+        # the `sheet_name` column in a single assignment instead of once per chunk.
+        df_chunks = pd.concat(chunks, ignore_index=True, copy=False)
+        df_chunks["sheet_name"] = np.repeat(sheet_names_list, sheet_lengths)
 
-            # Rename the columns to concatenate the chunks with the header.
-            columns = {i: col for i, col in enumerate(df_header.columns.tolist())}
-            last_column = len(columns)
-            columns[last_column] = "sheet_name"
+        # Rename the columns to concatenate the chunks with the header.
+        columns = {i: col for i, col in enumerate(df_header.columns.tolist())}
+        last_column = len(columns)
+        columns[last_column] = "sheet_name"
 
-            df_chunks.rename(columns=columns, inplace=True)
-            df = pd.concat([df_header, df_chunks])
+        df_chunks.rename(columns=columns, inplace=True)
+        df = pd.concat([df_header, df_chunks], ignore_index=True, copy=False)
 
         df = self.df_replace_special_chars(df)
         self.logger.info(f"Successfully converted data to a DataFrame.")
@@ -355,6 +381,7 @@ class SharepointListToDF(Task):
             ```
         """
         col_to_compare = df.columns.tolist()
+        columns_to_rename = {}
         i = 1
         for column in df.columns.tolist():
             if not column in self.required_fields:
@@ -363,8 +390,9 @@ class SharepointListToDF(Task):
                     i += 1
                     logger.info(f"Found duplicated column: {column} !")
                     logger.info(f"Renaming from {column} to {column}{i}")
-                    df = df.rename(columns={f"{column}": f"{column}{i}"})
-        return df
+                    columns_to_rename.setdefault(column, f"{column}{i}")
+        # Rename all duplicates at once instead of copying the DataFrame for each one.
+        return df.rename(columns=columns_to_rename)
 
     def _convert_camel_case_to_words(self, input_str: str) -> str:
         """
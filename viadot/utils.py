@@ -6,6 +6,7 @@ from typing import Any, Callable, Dict, List, Literal, Union
 
 import pandas as pd
 import prefect
+import pyarrow as pa
 import pyarrow.parquet
 import pyodbc
 import requests
@@ -208,6 +209,66 @@ def _cast_df_cols(df):
     return df
 
 
+def cast_df_mixed_dtypes_to_string(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast object columns holding values of mixed types to the `string` dtype.
+    pyarrow is not able to write such columns to Parquet or Feather files.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame.
+
+    Returns:
+        pd.DataFrame: DataFrame with mixed type columns casted to `string`.
+    """
+    columns_to_cast = {
+        col: "string"
+        for col in df.select_dtypes(include="object").columns
+        if pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+    }
+    if not columns_to_cast:
+        return df
+    return df.astype(columns_to_cast)
+
+
+def write_df_to_file(
+    df: pd.DataFrame,
+    path: str,
+    file_extension: Literal["parquet", "feather", "csv"],
+    sep: str = "\t",
+) -> None:
+    """
+    Write a DataFrame to a Parquet (snappy), Feather (zstd) or CSV file.
+    Parquet files are written through a 1 MiB buffer with 1 MiB data pages, to reduce
+    the number of small writes.
+
+    Args:
+        df (pd.DataFrame): DataFrame to write.
+        path (str): Destination file path.
+        file_extension (Literal["parquet", "feather", "csv"]): Format of the file.
+        sep (str, optional): Separator in csv file. Defaults to "\t".
+
+    Raises:
+        ValueError: If the `file_extension` is not supported.
+    """
+    if file_extension in ("parquet", "feather"):
+        df = cast_df_mixed_dtypes_to_string(df)
+
+    if file_extension == "parquet":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with open(path, "wb", buffering=1024 * 1024) as file:
+            pyarrow.parquet.write_table(
+                table, file, compression="snappy", data_page_size=1024 * 1024
+            )
+    elif file_extension == "feather":
+        df.to_feather(path, compression="zstd")
+    elif file_extension == "csv":
+        df.to_csv(path, index=False, sep=sep)
+    else:
+        raise ValueError(
+            f"File extension '{file_extension}' is not supported. Please use 'parquet', 'feather' or 'csv'."
+        )
+
+
 def build_merge_query(
     stg_schema: str,
     stg_table: str,